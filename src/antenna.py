@@ -1,142 +1,21 @@
 from build123d import *
-from ocp_vscode import *
 
+import argparse
 import os
 from math import atan, degrees
-from enum import Enum
-from dataclasses import dataclass
-from typing import List
 
 import housing
-from terminal import ChocoTerminal
+import mesh_boolean
+from parameters import *
 
 # Where to store the results
 output_path = os.path.dirname(os.path.realpath(__file__)) + '/../output/'
 output_variant = '1'
+# BREP: exact booleans. MESH: faster mesh booleans of the housing cutouts, for the STL output only.
+boolean_backend = housing.BooleanBackend.BREP
 
-# 3D printing technology constraints
-print_gap = 0.15
-# to keep the aluminium welding rod tight
-print_gap_element = 0.1
-# tighter gap to heat press the choco terminal into the housing
-print_gap_terminal = 0.1
-# Width of an extrusion line
-print_line_width=0.4
-
-# sleeve around the rod holding the element
-sleeve_thickness = 4 * print_line_width
-# Lenght of the laminate fishing rod
-l_rod=1130
-# Diameter of the laminate fishing rod, base
-d_rod_base=19.5
-# Diameter of the laminate fishing rod, tip
-d_rod_tip=16
-
-# Diameter of the aluminium element 1/8 of an inch
-dmr_element=3.175
-
-screw_terminal = ChocoTerminal.make_terminal_10mm2()
-# Gap between the left / right terminals. To be filled with a FR4 separator.
-terminal_spacing = 1.6
-terminal_extra_width = 2 * print_line_width
-
-# Width of the element housing along the element
-element_housing_width = 21 + 2 * print_gap + 2 * sleeve_thickness
-element_housing_length = 18
-element_housing_wall_thickness = 2*print_line_width
-# Make the housing a bit thicker at the far end to increase layer bonding
-# of the tube around the element.
-element_housing_wall_thickness_extra = 1 * print_line_width
-
-# Positions of 2m elements with regard to the base of the rod
-# Distance between the center of the reflector and the center of the last director.
-l_2m=1016
-pos_base=l_rod - l_2m - (dmr_element/2 + print_gap_element + element_housing_wall_thickness)
-pos_2m_reflector=pos_base - 30
-pos_2m_driven_element=pos_2m_reflector + 50 + 560
-pos_2m_director1=pos_2m_reflector + 50 + 860
-# Length of 2m elements
-l_2m_reflector=1028.7
-l_2m_director1=927.1
-l_2m_director2=825.5
- 
-# Positions of 70cm elements with regard to the base of the rod
-# Distance between the center of the reflector and the center of the last director.
-l_70cm=958.9
-#pos_70cm_reflector=pos_2m_reflector + ( l_2m - l_70cm ) / 2
-pos_70cm_reflector=pos_base + 19
-pos_70cm_driven_element=pos_70cm_reflector + 63.5
-pos_70cm_director1=pos_70cm_reflector + 139.7
-pos_70cm_director2=pos_70cm_reflector + 285.8
-pos_70cm_director3=pos_70cm_reflector + 444.5
-pos_70cm_director4=pos_70cm_reflector + 609.6
-pos_70cm_director5=pos_70cm_reflector + 774.7
-pos_70cm_director6=pos_70cm_reflector + l_70cm
-# Length of 70cm elements
-l_70cm_reflector=340.4
-l_70cm_director1=315
-l_70cm_director2=304.8
-l_70cm_director3=304.8
-l_70cm_director4=304.8
-l_70cm_director5=304.8
-l_70cm_director6=281.9
-
-elevation_rod_element_70cm=print_gap+2*print_line_width+dmr_element/2
-elevation_rod_element_2m=print_gap+2*print_line_width+screw_terminal.outer_diameter/2
-
-class ElementType(Enum):
-    WIRE = 0
-    CHOCO = 1
-
-class Polarization(Enum):
-    HORIZONTAL = 0
-    VERTICAL = 1
-
-@dataclass
-class Element:
-    position: float
-    length:   float
-    reversed: bool
-    label:    str
-
-@dataclass
-class Elements:
-    elements: List[Element]
-    type: ElementType
-    polarization: Polarization
-    elevation: float
-
-elements_2m_data = Elements(
-    elements = [
-        Element(pos_2m_reflector, l_2m_reflector, False, "2R"),
-        Element(pos_2m_driven_element, l_2m_director1, False, "2D"),
-        Element(pos_2m_director1, l_2m_director1, True, "21"),
-    ],
-    type = ElementType.CHOCO,
-    polarization = Polarization.HORIZONTAL,
-    elevation = elevation_rod_element_2m
-)
-
-elements_70cm_data = Elements(
-    elements = [
-        Element(pos_70cm_reflector, l_70cm_reflector, True, "7R"),
-        Element(pos_70cm_driven_element, l_70cm_director1, False, "7D"),
-        Element(pos_70cm_director1, l_70cm_director1, False, "71"),
-        Element(pos_70cm_director2, l_70cm_director2, False, "72"),
-        Element(pos_70cm_director3, l_70cm_director3, False, "73"),
-        Element(pos_70cm_director4, l_70cm_director4, False, "74"),
-        Element(pos_70cm_director5, l_70cm_director5, False, "75"),
-        Element(pos_70cm_director6, l_70cm_director6, True, "76"),
-    ],
-    type = ElementType.WIRE,
-    polarization = Polarization.VERTICAL,
-    elevation = elevation_rod_element_70cm
-)
-
-rod = loft([Circle(d_rod_base/2), Pos(0, 0, l_rod) * Circle(d_rod_tip/2)])
-
-def rod_radius(pos):
-    return 0.5 * (d_rod_base - pos * (d_rod_base - d_rod_tip) / l_rod)
+def make_rod():
+    return loft([Circle(d_rod_base/2), Pos(0, 0, l_rod) * Circle(d_rod_tip/2)])
 
 def element(polarization: Polarization, position, length, elevation, dmr = dmr_element):
     return (
@@ -161,12 +40,6 @@ def screw_terminals(element_data):
         elements.append(Pos(- screw_terminal.length/2 - gap/2, rod_radius(el.position) + element_data.elevation, el.position) * t)
     return Part() + elements
 
-#print("Close encounters of 2m and 70cm elements: ", elements_70cm_data.elements[0][0] - elements_2m_data.elements[0][0], elements_70cm_data.elements[4].position - elements_2m_data[2].position, elements_70cm_data[7].position - elements_2m_data[3].position)
-print("Distance of the tip 2m rod from the laminate rod tip:", 
-      l_rod - elements_2m_data.elements[2].position)
-print("Distance of the 2m reflector from the laminate rod base:", 
-      elements_2m_data.elements[0].position)
-
 def element_housing(type: ElementType, polarization: Polarization, pos, reversed, elevation, label):
     assert d_rod_base > d_rod_tip
     boom_taper_angle = degrees(atan((d_rod_tip - d_rod_base) / l_rod))
@@ -183,7 +56,8 @@ def element_housing(type: ElementType, polarization: Polarization, pos, reversed
             element_above_boom_axis = rod_radius(pos) + elevation,
             element_wall = print_gap_element + element_housing_wall_thickness,
             element_wall_top_extra = element_housing_wall_thickness_extra,
-            label = housing.Label(labels=[label[0], label[1]], font='Arial Black', size=6, depth=.28))
+            label = housing.Label(labels=[label[0], label[1]], font='Arial Black', size=6, depth=.28),
+            boolean_backend = boolean_backend)
     elif type == ElementType.CHOCO:
         body = housing.element_holder_for_choco_terminal(
             sleeve_base_radius = rod_radius(pos) + print_gap,
@@ -198,7 +72,8 @@ def element_housing(type: ElementType, polarization: Polarization, pos, reversed
             element_wall = print_gap_element + element_housing_wall_thickness,
             element_wall_top_extra = element_housing_wall_thickness_extra,
             print_gap = print_gap_terminal,
-            label = housing.Label(labels=[label[0], label[1]], font='Arial Black', size=6, depth=.28))
+            label = housing.Label(labels=[label[0], label[1]], font='Arial Black', size=6, depth=.28),
+            boolean_backend = boolean_backend)
     else:
         raise ValueError(f"Unknown element type: {type}")
 
@@ -215,7 +90,8 @@ def element_housings(element_data):
                              this_element_data.reversed, element_data.elevation, this_element_data.label)
         housings.append((this_element_data, el))
         models.append(el)
-    return (housings, Part() + models)
+    # Meshes produced by the mesh backend cannot be fused by the BRep kernel.
+    return (housings, Compound(children=models) if boolean_backend == housing.BooleanBackend.MESH else Part() + models)
 
 def export_elements_stl(elements, polarization: Polarization):
     os.makedirs(output_path, exist_ok=True)
@@ -242,27 +118,46 @@ def export_elements_stl(elements, polarization: Polarization):
     #        )
             exporter.add_code_to_metadata()
             exporter.write(output_path+label+".stl") # or 3mf
+        elif boolean_backend == housing.BooleanBackend.MESH:
+            mesh_boolean.export_stl(model, output_path+label+".stl")
         else:
             export_stl(model, output_path+label+".stl")
 
-elements_2m = elements(elements_2m_data)
-housings_2m, housings_2m_model = element_housings(elements_2m_data)
-screw_terminals_2m = screw_terminals(elements_2m_data)
-
-polarization_70cm = Polarization.VERTICAL
-elements_70cm = elements(elements_70cm_data)
-housings_70cm, housings_70cm_model = element_housings(elements_70cm_data)
-
-color_rod = Color(.35, .35, .35)
-color_elements = Color("yellow")
-color_housing = Color(1, .5, .5)
-
-show_object(rod, name="rod", options={"color": color_rod.to_tuple()})
-show_object(elements_2m, name="2m elements", options={"color": color_elements.to_tuple()})
-show_object(elements_70cm, name="70cm elements", options={"color": color_elements.to_tuple()})
-show_object(housings_2m_model, name="2m housing", options={"color": color_housing.to_tuple()})
-show_object(housings_70cm_model, name="70cm housing", options={"color": color_housing.to_tuple()})
-show_object(screw_terminals_2m, name="2m screw terminals", options={"color": color_elements.to_tuple()})
-
-export_elements_stl(housings_2m, elements_2m_data.polarization)
-export_elements_stl(housings_70cm, elements_70cm_data.polarization)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the Lakeside YAGI element housings and export them to STL.")
+    parser.add_argument("--no-viewer", action="store_true", help="Do not show the models in the OCP CAD viewer.")
+    args = parser.parse_args()
+
+    #print("Close encounters of 2m and 70cm elements: ", elements_70cm_data.elements[0][0] - elements_2m_data.elements[0][0], elements_70cm_data.elements[4].position - elements_2m_data[2].position, elements_70cm_data[7].position - elements_2m_data[3].position)
+    print("Distance of the tip 2m rod from the laminate rod tip:", 
+          l_rod - elements_2m_data.elements[2].position)
+    print("Distance of the 2m reflector from the laminate rod base:", 
+          elements_2m_data.elements[0].position)
+
+    elements_2m = elements(elements_2m_data)
+    housings_2m, housings_2m_model = element_housings(elements_2m_data)
+    screw_terminals_2m = screw_terminals(elements_2m_data)
+
+    polarization_70cm = Polarization.VERTICAL
+    elements_70cm = elements(elements_70cm_data)
+    housings_70cm, housings_70cm_model = element_housings(elements_70cm_data)
+
+    rod = make_rod()
+
+    if not args.no_viewer:
+        from ocp_vscode import show_object
+        color_rod = Color(.35, .35, .35)
+        color_elements = Color("yellow")
+        color_housing = Color(1, .5, .5)
+
+        show_object(rod, name="rod", options={"color": color_rod.to_tuple()})
+        show_object(elements_2m, name="2m elements", options={"color": color_elements.to_tuple()})
+        show_object(elements_70cm, name="70cm elements", options={"color": color_elements.to_tuple()})
+        # The housings built by the mesh backend carry a triangulation only, they are exported to STL, not shown.
+        if boolean_backend == housing.BooleanBackend.BREP:
+            show_object(housings_2m_model, name="2m housing", options={"color": color_housing.to_tuple()})
+            show_object(housings_70cm_model, name="70cm housing", options={"color": color_housing.to_tuple()})
+        show_object(screw_terminals_2m, name="2m screw terminals", options={"color": color_elements.to_tuple()})
+
+    export_elements_stl(housings_2m, elements_2m_data.polarization)
+    export_elements_stl(housings_70cm, elements_70cm_data.polarization)
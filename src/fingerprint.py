@@ -0,0 +1,140 @@
+import json
+from dataclasses import dataclass, asdict, fields
+from math import sqrt
+from typing import Dict, List, Tuple
+
+from build123d import *
+from build123d import Shape
+
+import numpy as np
+from OCP.BRep import BRep_Tool
+from OCP.TopAbs import TopAbs_REVERSED
+from OCP.TopLoc import TopLoc_Location
+
+# Geometry fingerprints: a compact summary of a built solid to detect changes of the printed parts
+# without comparing the STLs, and to validate cached geometry: a cached shape is valid
+# if fingerprint(shape, expected.tolerance).matches(expected).
+# Both BRep solids and the triangulated faces produced by the mesh boolean backend or by import_stl()
+# are supported. The latter are fingerprinted from their triangulation, with the numbers of faces and edges
+# replaced by the number of triangles.
+
+# Length quantum in mm, well below the print gaps, see parameters.py.
+print_tolerance = 0.01
+
+def _quantize(value: float, quantum: float) -> float:
+    return round(round(value / quantum) * quantum, 9)
+
+@dataclass
+class Fingerprint:
+    volume:     float
+    area:       float
+    bbox_min:   Tuple[float, float, float]
+    bbox_max:   Tuple[float, float, float]
+    center:     Tuple[float, float, float]  # center of mass
+    faces:      int
+    edges:      int
+    triangles:  int = 0     # triangulated shapes only, faces and edges are zero then
+    tolerance:  float = print_tolerance
+
+    # Quanta of the individual fields: A rib of tolerance x tolerance cross section along the whole part
+    # changes the volume by tolerance^2 * size and the area by tolerance * size. Thus a 0.28 mm deep label
+    # changes both the volume and the area by many quanta.
+    def quanta(self) -> Dict[str, float]:
+        diagonal = max(sqrt(sum((b - a)**2 for a, b in zip(self.bbox_min, self.bbox_max))), self.tolerance)
+        return {
+            'volume':    self.tolerance**2 * diagonal,
+            'area':      self.tolerance * diagonal,
+            'bbox_min':  self.tolerance,
+            'bbox_max':  self.tolerance,
+            'center':    self.tolerance,
+            'faces':     0,
+            'edges':     0,
+            'triangles': 0,
+        }
+
+    def diff(self, other: 'Fingerprint') -> List[str]:
+        """Compare with other (golden) fingerprint, return descriptions of the fields differing
+           by more than one quantum of other. Empty list if the fingerprints match.
+        """
+        quanta = other.quanta()
+        out = []
+        for name, quantum in quanta.items():
+            a, b = getattr(self, name), getattr(other, name)
+            if isinstance(a, tuple):
+                differs = any(abs(x - y) > quantum + 1e-9 for x, y in zip(a, b))
+            else:
+                differs = abs(a - b) > quantum + 1e-9
+            if differs:
+                out.append(f"{name}: {a} != {b}")
+        return out
+
+    def matches(self, other: 'Fingerprint') -> bool:
+        return not self.diff(other)
+
+    @classmethod
+    def from_dict(cls, d: dict):
+        return cls(**{f.name: tuple(d[f.name]) if isinstance(d[f.name], list) else d[f.name]
+                      for f in fields(cls) if f.name in d})
+
+def _triangulation(face: Face):
+    """Vertices and consistently oriented triangles of a face carrying a triangulation."""
+    loc = TopLoc_Location()
+    poly = BRep_Tool.Triangulation_s(face.wrapped, loc)
+    trsf = loc.Transformation()
+    vertices = np.array([poly.Node(i).Transformed(trsf).Coord() for i in range(1, poly.NbNodes() + 1)])
+    triangles = np.array([poly.Triangle(i).Get() for i in range(1, poly.NbTriangles() + 1)]) - 1
+    if face.wrapped.Orientation() == TopAbs_REVERSED:
+        triangles = triangles[:, ::-1]
+    return vertices, triangles
+
+def _fingerprint_triangulation(face: Face, tolerance: float) -> Fingerprint:
+    vertices, triangles = _triangulation(face)
+    v0, v1, v2 = (vertices[triangles[:, i]] for i in range(3))
+    cross = np.cross(v1 - v0, v2 - v0)
+    # Signed volumes of the tetrahedra spanned by the triangles and the origin.
+    volumes = np.einsum('ij,ij->i', v0, np.cross(v1, v2)) / 6.
+    volume = volumes.sum()
+    return Fingerprint(
+        volume = volume,
+        area = 0.5 * np.linalg.norm(cross, axis=1).sum(),
+        bbox_min = tuple(vertices.min(axis=0)),
+        bbox_max = tuple(vertices.max(axis=0)),
+        center = tuple((volumes[:, None] * (v0 + v1 + v2)).sum(axis=0) / (4. * volume)),
+        faces = 0,
+        edges = 0,
+        triangles = len(triangles),
+        tolerance = tolerance)
+
+def fingerprint(shape: Shape, tolerance: float = print_tolerance) -> Fingerprint:
+    """Fingerprint of a solid or of a triangulated face quantized to tolerance."""
+    if isinstance(shape, Face) and not BRep_Tool.IsGeometric_s(shape.wrapped):
+        fp = _fingerprint_triangulation(shape, tolerance)
+    elif shape.volume > 0:
+        bbox = shape.bounding_box()
+        center = shape.center(CenterOf.MASS)
+        fp = Fingerprint(
+            volume = shape.volume,
+            area = shape.area,
+            bbox_min = (bbox.min.X, bbox.min.Y, bbox.min.Z),
+            bbox_max = (bbox.max.X, bbox.max.Y, bbox.max.Z),
+            center = (center.X, center.Y, center.Z),
+            faces = len(shape.faces()),
+            edges = len(shape.edges()),
+            tolerance = tolerance)
+    else:
+        raise ValueError("Only solids and triangulated faces can be fingerprinted")
+    for name in ('bbox_min', 'bbox_max', 'center'):
+        setattr(fp, name, tuple(_quantize(float(x), tolerance) for x in getattr(fp, name)))
+    quanta = fp.quanta()
+    fp.volume = _quantize(float(fp.volume), quanta['volume'])
+    fp.area = _quantize(float(fp.area), quanta['area'])
+    return fp
+
+def save(fingerprints: Dict[str, Fingerprint], file_path: str):
+    with open(file_path, 'w') as f:
+        json.dump({name: asdict(fp) for name, fp in sorted(fingerprints.items())}, f, indent=2)
+        f.write('\n')
+
+def load(file_path: str) -> Dict[str, Fingerprint]:
+    with open(file_path) as f:
+        return {name: Fingerprint.from_dict(d) for name, d in json.load(f).items()}
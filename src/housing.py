@@ -1,14 +1,32 @@
 from dataclasses import dataclass
+from enum import Enum
 from typing import List
 from build123d import *
-from ocp_vscode import *
+from build123d import Shape
 
 from math import sin, cos, tan, asin, acos, atan, atan2, pi, floor, sqrt, degrees, radians
 
 from util import circle_pivot_tangent_angle
 
+import mesh_boolean
 import terminal
 
+class BooleanBackend(Enum):
+    # Exact BRep booleans of the OCCT kernel.
+    BREP = 0
+    # Booleans on tessellated operands, see mesh_boolean.py. Only good for STL export.
+    MESH = 1
+
+def subtract(body, tools: List[Shape], backend: BooleanBackend = BooleanBackend.BREP):
+    """Subtract the tools from body. The mesh backend subtracts all the tools in a single boolean operation,
+       the BRep backend one tool after another.
+    """
+    if backend == BooleanBackend.MESH:
+        return mesh_boolean.subtract(body, tools)
+    for tool in tools:
+        body -= tool
+    return body
+
 def make_c_sleeve(
     r1:         float,  # Radius at Z=0
     r2:         float,  # Radius at Z=length 
@@ -180,7 +198,9 @@ def element_holder_body(
     housing_bottom:     float,  # Top of the housing profile rectangle
     housing_profile:    Face,   # Extra profile, used for choco terminal
     v_dent_depth:       float,
-    label:              Label): # Half height of the element housing rectangle
+    label:              Label,  # Half height of the element housing rectangle
+    cutouts:            List[Shape] = None, # Subtracted from the body together with the labels
+    boolean_backend:    BooleanBackend = BooleanBackend.BREP):
 
     sleeve = make_c_sleeve_slice(
         base_radius=sleeve_base_radius,
@@ -204,10 +224,13 @@ def element_holder_body(
     
     body = sleeve + housing
 
+    tools = []
     if label:
-        for l in gen_labels(label, housing_width, housing_top):
-            body -= Pos(0, 0, - housing_depth/2) * Rotation(0., 180., 0.) * l
-    return body
+        tools += [Pos(0, 0, - housing_depth/2) * Rotation(0., 180., 0.) * l 
+                  for l in gen_labels(label, housing_width, housing_top)]
+    if cutouts:
+        tools += cutouts
+    return subtract(body, tools, boolean_backend)
 
 def element_holder_for_wire(
     sleeve_base_radius:     float,
@@ -220,11 +243,13 @@ def element_holder_for_wire(
     element_above_boom_axis: float,
     element_wall:           float,
     element_wall_top_extra: float,
-    label:                  Label):
+    label:                  Label,
+    boolean_backend:        BooleanBackend = BooleanBackend.BREP):
 
     h = element_dmr + 2*element_wall
 #    assert element_above_boom_axis - h/2 > sleeve_base_radius
-    body = element_holder_body(
+    wire = Pos(0, element_above_boom_axis) * Cylinder(element_dmr/2, housing_width, rotation=(0., -90., 0.))
+    return element_holder_body(
         sleeve_base_radius=sleeve_base_radius,
         sleeve_thickness=sleeve_thickness,
         sleeve_length=sleeve_length,
@@ -236,10 +261,9 @@ def element_holder_for_wire(
         housing_bottom=sleeve_base_radius,
         housing_profile=None, # extra profile, not used here
         v_dent_depth=3 * h / 4, # + element_wall_top_extra, #3 * h / 8 + element_wall_top_extra,
-        label=label)
-#    show_object(body, 'body')
-    wire = Pos(0, element_above_boom_axis) * Cylinder(element_dmr/2, housing_width, rotation=(0., -90., 0.))
-    return body - wire
+        label=label,
+        cutouts=[wire],
+        boolean_backend=boolean_backend)
 
 def element_holder_for_choco_terminal(
     sleeve_base_radius:     float,
@@ -254,27 +278,11 @@ def element_holder_for_choco_terminal(
     element_wall:           float,
     element_wall_top_extra: float,
     print_gap:              float, # 3D printing technology constraint: Gap between the terminal and the element
-    label:                  Label):
+    label:                  Label,
+    boolean_backend:        BooleanBackend = BooleanBackend.BREP):
 
     terminal_top = terminal.height - terminal.outer_diameter / 2
     housing_width = terminal_spacing + 2 * (terminal.length + extra_width)
-    body = element_holder_body(
-        sleeve_base_radius=sleeve_base_radius,
-        sleeve_thickness=sleeve_thickness,
-        sleeve_length=sleeve_length,
-        sleeve_angle=sleeve_angle,
-        boom_taper_angle=boom_taper_angle,
-        housing_width=housing_width,
-        housing_depth=terminal.outer_diameter + 2 * print_gap + 2 * element_wall,
-        housing_top=element_above_boom_axis + terminal_top + element_wall + element_wall_top_extra,
-        housing_bottom=sleeve_base_radius,
-        housing_profile=Pos(0, element_above_boom_axis + element_wall_top_extra) * \
-            terminal.teardrop_profile(print_gap + element_wall),
-        v_dent_depth=terminal_top, # + element_wall_top_extra, #3 * h / 8 + element_wall_top_extra,
-        label=label)
-#    show_object(body, 'body')
-#    wire = Pos(0, element_above_boom_axis) * Cylinder(element_dmr/2, housing_width, rotation=(0., -90., 0.))
-#    return body - wire
     through = extrude(to_extrude = Plane.ZY * terminal.teardrop_profile_inner(print_gap), 
                       amount = housing_width)
     screw = Rotation(0, 90, 0) * Rotation(0, 0, terminal.tangent_angle()) * \
@@ -287,8 +295,25 @@ def element_holder_for_choco_terminal(
                 Pos(- screw_offset_inner) * screw,
                 Pos(screw_offset_outer) * screw, 
                 Pos(- screw_offset_outer) * screw]
-    
-    throughs = Pos(0., element_above_boom_axis, 0) * (Part() + throughs)
- #   show_object([body, throughs])
- #   exit(0)
-    return body - throughs
+    # The mesh backend subtracts all the throughs at once, the BRep backend fuses them first.
+    if boolean_backend == BooleanBackend.MESH:
+        throughs = [Pos(0., element_above_boom_axis, 0) * t for t in throughs]
+    else:
+        throughs = [Pos(0., element_above_boom_axis, 0) * (Part() + throughs)]
+
+    return element_holder_body(
+        sleeve_base_radius=sleeve_base_radius,
+        sleeve_thickness=sleeve_thickness,
+        sleeve_length=sleeve_length,
+        sleeve_angle=sleeve_angle,
+        boom_taper_angle=boom_taper_angle,
+        housing_width=housing_width,
+        housing_depth=terminal.outer_diameter + 2 * print_gap + 2 * element_wall,
+        housing_top=element_above_boom_axis + terminal_top + element_wall + element_wall_top_extra,
+        housing_bottom=sleeve_base_radius,
+        housing_profile=Pos(0, element_above_boom_axis + element_wall_top_extra) * \
+            terminal.teardrop_profile(print_gap + element_wall),
+        v_dent_depth=terminal_top, # + element_wall_top_extra, #3 * h / 8 + element_wall_top_extra,
+        label=label,
+        cutouts=throughs,
+        boolean_backend=boolean_backend)
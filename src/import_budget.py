@@ -0,0 +1,51 @@
+# Check that the parameter and math layer (parameters.py, terminal.py, util.py) imports
+# without the CAD kernel and the viewer, and within the import time budget.
+# Each module is imported in a fresh interpreter, the interpreter startup itself is not measured.
+# The best of several runs is compared against the budget to filter out the noise of a loaded machine.
+#
+#   python import_budget.py
+
+import os
+import subprocess
+import sys
+
+# Import time budgets in milliseconds, about 3x the best measured times
+# (util 0.7 ms, terminal 12 ms, parameters 14 ms on Python 3.11).
+budgets_ms = {
+    'util':         5,
+    'terminal':     40,
+    'parameters':   40,
+}
+# Number of runs per module.
+runs = 5
+
+# Modules, which must not be loaded by the parameter and math layer.
+heavy_modules = ['build123d', 'OCP', 'ocp_vscode', 'manifold3d']
+
+probe = '''
+import sys, time
+t = time.perf_counter()
+import {module}
+print((time.perf_counter() - t) * 1000.)
+print(','.join(m for m in {heavy_modules} if m in sys.modules))
+'''
+
+def measure(module: str):
+    """Import module in a fresh interpreter, return import time in milliseconds and the heavy modules loaded."""
+    out = subprocess.run([sys.executable, '-c', probe.format(module=module, heavy_modules=heavy_modules)],
+                         cwd=os.path.dirname(os.path.realpath(__file__)),
+                         capture_output=True, text=True, check=True).stdout.split('\n')
+    return float(out[0]), [m for m in out[1].split(',') if m]
+
+if __name__ == "__main__":
+    failed = False
+    for module, budget in budgets_ms.items():
+        results = [measure(module) for i in range(runs)]
+        time_ms = min(t for t, _ in results)
+        loaded = sorted(set(m for _, l in results for m in l))
+        ok = time_ms <= budget and not loaded
+        failed |= not ok
+        print(f"{module:12} {time_ms:7.1f} ms (best of {runs}, budget {budget} ms)" +
+              (f", loads {', '.join(loaded)}" if loaded else "") +
+              ("" if ok else "  FAILED"))
+    sys.exit(1 if failed else 0)
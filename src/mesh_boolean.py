@@ -0,0 +1,84 @@
+from typing import List
+
+from build123d import *
+from build123d import Shape
+
+import numpy as np
+from OCP.BRep import BRep_Builder
+from OCP.gp import gp_Pnt
+from OCP.Poly import Poly_Triangle, Poly_Triangulation
+from OCP.StlAPI import StlAPI_Writer
+from OCP.TopoDS import TopoDS_Face
+
+# Mesh boolean backend for the housing cutouts.
+# The operands are tessellated and subtracted by the manifold3d kernel,
+# the result is returned as a build123d Face carrying a triangulation only.
+# Such a Face is good for STL export and for viewing, but not for further BRep operations,
+# thus this backend is meant for the STL only output paths, where build time matters more
+# than an exact BRep.
+
+# Tessellation tolerances, in line with the defaults of export_stl().
+tolerance = 1e-3
+angular_tolerance = 0.1
+# Vertices closer than this are welded after tessellation.
+weld_tolerance = 1e-5
+
+def _manifold3d():
+    try:
+        import manifold3d
+    except ImportError as e:
+        raise ImportError("The mesh boolean backend requires the manifold3d package: pip install manifold3d") from e
+    return manifold3d
+
+def to_manifold(shape: Shape):
+    """Tessellate a build123d solid into a manifold3d Manifold."""
+    manifold3d = _manifold3d()
+    vertices, triangles = shape.tessellate(tolerance, angular_tolerance)
+    vertices = [(v.X, v.Y, v.Z) for v in vertices]
+    vertices = np.array(vertices, dtype=np.float64).reshape(-1, 3)
+    triangles = np.array(triangles, dtype=np.int64).reshape(-1, 3)
+    # Shape.tessellate() triangulates each BRep face separately, thus the vertices along
+    # the shared edges are duplicated. Weld them to make the mesh watertight.
+    vertices, remap = np.unique(np.round(vertices / weld_tolerance), axis=0, return_inverse=True)
+    vertices *= weld_tolerance
+    triangles = remap.reshape(-1)[triangles]
+    # Drop triangles degenerated by welding.
+    triangles = triangles[(triangles[:, 0] != triangles[:, 1]) &
+                          (triangles[:, 1] != triangles[:, 2]) &
+                          (triangles[:, 2] != triangles[:, 0])]
+    m = manifold3d.Manifold(manifold3d.Mesh(
+        vert_properties=vertices.astype(np.float32), tri_verts=triangles.astype(np.uint32)))
+    if m.status() != manifold3d.Error.NoError:
+        raise ValueError(f"Tessellated shape is not a manifold: {m.status()}")
+    return m
+
+def to_shape(manifold) -> Face:
+    """Convert a manifold3d Manifold into a build123d Face carrying the triangulation."""
+    mesh = manifold.to_mesh()
+    vertices = mesh.vert_properties[:, :3]
+    triangles = mesh.tri_verts
+    poly = Poly_Triangulation(len(vertices), len(triangles), False)
+    for i, (x, y, z) in enumerate(vertices, start=1):
+        poly.SetNode(i, gp_Pnt(float(x), float(y), float(z)))
+    for i, (a, b, c) in enumerate(triangles, start=1):
+        poly.SetTriangle(i, Poly_Triangle(int(a) + 1, int(b) + 1, int(c) + 1))
+    poly.Deflection(tolerance)
+    face = TopoDS_Face()
+    BRep_Builder().MakeFace(face, poly)
+    return Face(face)
+
+def subtract(body: Shape, tools: List[Shape]) -> Face:
+    """body - tools evaluated on meshes, see the module comment."""
+    manifold3d = _manifold3d()
+    result = manifold3d.Manifold.batch_boolean(
+        [to_manifold(body)] + [to_manifold(tool) for tool in tools],
+        manifold3d.OpType.Subtract)
+    return to_shape(result)
+
+def export_stl(shape: Shape, file_path: str) -> bool:
+    """Export a Face produced by to_shape() into STL.
+       Unlike build123d.export_stl(), the shape is not re-meshed, its triangulation is written as is.
+    """
+    writer = StlAPI_Writer()
+    writer.ASCIIMode = False
+    return writer.Write(shape.wrapped, file_path)
@@ -0,0 +1,130 @@
+# Parameters of the antenna and of the element housings.
+# Pure data and math, importable without the CAD kernel, see antenna.py for the geometry.
+
+from enum import Enum
+from dataclasses import dataclass
+from typing import List
+
+from terminal import ChocoTerminal
+
+# 3D printing technology constraints
+print_gap = 0.15
+# to keep the aluminium welding rod tight
+print_gap_element = 0.1
+# tighter gap to heat press the choco terminal into the housing
+print_gap_terminal = 0.1
+# Width of an extrusion line
+print_line_width=0.4
+
+# sleeve around the rod holding the element
+sleeve_thickness = 4 * print_line_width
+# Lenght of the laminate fishing rod
+l_rod=1130
+# Diameter of the laminate fishing rod, base
+d_rod_base=19.5
+# Diameter of the laminate fishing rod, tip
+d_rod_tip=16
+
+# Diameter of the aluminium element 1/8 of an inch
+dmr_element=3.175
+
+screw_terminal = ChocoTerminal.make_terminal_10mm2()
+# Gap between the left / right terminals. To be filled with a FR4 separator.
+terminal_spacing = 1.6
+terminal_extra_width = 2 * print_line_width
+
+# Width of the element housing along the element
+element_housing_width = 21 + 2 * print_gap + 2 * sleeve_thickness
+element_housing_length = 18
+element_housing_wall_thickness = 2*print_line_width
+# Make the housing a bit thicker at the far end to increase layer bonding
+# of the tube around the element.
+element_housing_wall_thickness_extra = 1 * print_line_width
+
+# Positions of 2m elements with regard to the base of the rod
+# Distance between the center of the reflector and the center of the last director.
+l_2m=1016
+pos_base=l_rod - l_2m - (dmr_element/2 + print_gap_element + element_housing_wall_thickness)
+pos_2m_reflector=pos_base - 30
+pos_2m_driven_element=pos_2m_reflector + 50 + 560
+pos_2m_director1=pos_2m_reflector + 50 + 860
+# Length of 2m elements
+l_2m_reflector=1028.7
+l_2m_director1=927.1
+l_2m_director2=825.5
+ 
+# Positions of 70cm elements with regard to the base of the rod
+# Distance between the center of the reflector and the center of the last director.
+l_70cm=958.9
+#pos_70cm_reflector=pos_2m_reflector + ( l_2m - l_70cm ) / 2
+pos_70cm_reflector=pos_base + 19
+pos_70cm_driven_element=pos_70cm_reflector + 63.5
+pos_70cm_director1=pos_70cm_reflector + 139.7
+pos_70cm_director2=pos_70cm_reflector + 285.8
+pos_70cm_director3=pos_70cm_reflector + 444.5
+pos_70cm_director4=pos_70cm_reflector + 609.6
+pos_70cm_director5=pos_70cm_reflector + 774.7
+pos_70cm_director6=pos_70cm_reflector + l_70cm
+# Length of 70cm elements
+l_70cm_reflector=340.4
+l_70cm_director1=315
+l_70cm_director2=304.8
+l_70cm_director3=304.8
+l_70cm_director4=304.8
+l_70cm_director5=304.8
+l_70cm_director6=281.9
+
+elevation_rod_element_70cm=print_gap+2*print_line_width+dmr_element/2
+elevation_rod_element_2m=print_gap+2*print_line_width+screw_terminal.outer_diameter/2
+
+class ElementType(Enum):
+    WIRE = 0
+    CHOCO = 1
+
+class Polarization(Enum):
+    HORIZONTAL = 0
+    VERTICAL = 1
+
+@dataclass
+class Element:
+    position: float
+    length:   float
+    reversed: bool
+    label:    str
+
+@dataclass
+class Elements:
+    elements: List[Element]
+    type: ElementType
+    polarization: Polarization
+    elevation: float
+
+elements_2m_data = Elements(
+    elements = [
+        Element(pos_2m_reflector, l_2m_reflector, False, "2R"),
+        Element(pos_2m_driven_element, l_2m_director1, False, "2D"),
+        Element(pos_2m_director1, l_2m_director1, True, "21"),
+    ],
+    type = ElementType.CHOCO,
+    polarization = Polarization.HORIZONTAL,
+    elevation = elevation_rod_element_2m
+)
+
+elements_70cm_data = Elements(
+    elements = [
+        Element(pos_70cm_reflector, l_70cm_reflector, True, "7R"),
+        Element(pos_70cm_driven_element, l_70cm_director1, False, "7D"),
+        Element(pos_70cm_director1, l_70cm_director1, False, "71"),
+        Element(pos_70cm_director2, l_70cm_director2, False, "72"),
+        Element(pos_70cm_director3, l_70cm_director3, False, "73"),
+        Element(pos_70cm_director4, l_70cm_director4, False, "74"),
+        Element(pos_70cm_director5, l_70cm_director5, False, "75"),
+        Element(pos_70cm_director6, l_70cm_director6, True, "76"),
+    ],
+    type = ElementType.WIRE,
+    polarization = Polarization.VERTICAL,
+    elevation = elevation_rod_element_70cm
+)
+
+def rod_radius(pos):
+    return 0.5 * (d_rod_base - pos * (d_rod_base - d_rod_tip) / l_rod)
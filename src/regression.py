@@ -0,0 +1,90 @@
+# Regression check of the built geometry: fingerprints of all the configured housings, elements
+# and of the screw terminal are compared against the golden values stored in fingerprints.json.
+#
+#   python regression.py            # compare against the golden values
+#   python regression.py --update   # rebuild the golden values after an intended change
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from parameters import *
+
+golden_path = os.path.dirname(os.path.realpath(__file__)) + '/fingerprints.json'
+
+def parts():
+    """Names of all the parts to fingerprint. Cheap, does not touch the CAD kernel."""
+    names = ['terminal']
+    for element_data in (elements_2m_data, elements_70cm_data):
+        for el in element_data.elements:
+            names += ['housing-' + el.label, 'element-' + el.label]
+    return names
+
+def build_fingerprint(name: str):
+    """Build a single part and return its fingerprint, or the error message if the build failed.
+       Executed by the worker processes.
+    """
+    try:
+        return name, _build_fingerprint(name)
+    except Exception as e:
+        return name, f"{type(e).__name__}: {e}"
+
+def _build_fingerprint(name: str):
+    import antenna
+    import fingerprint
+    if name == 'terminal':
+        return fingerprint.fingerprint(screw_terminal.body())
+    kind, label = name.split('-')
+    element_data, el = next(((element_data, el) for element_data in (elements_2m_data, elements_70cm_data)
+                             for el in element_data.elements if el.label == label), (None, None))
+    if el is None:
+        raise ValueError(f"Unknown part {name}")
+    if kind == 'housing':
+        shape = antenna.element_housing(element_data.type, element_data.polarization, el.position,
+                                        el.reversed, element_data.elevation, el.label)
+    else:
+        shape = antenna.element(element_data.polarization, el.position, el.length, element_data.elevation)
+    return fingerprint.fingerprint(shape)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare fingerprints of the built parts against the golden values.")
+    parser.add_argument("--update", action="store_true", help="Store the current fingerprints as the golden values.")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="Number of worker processes.")
+    args = parser.parse_args()
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        current = dict(executor.map(build_fingerprint, parts()))
+
+    import fingerprint
+    errors = {name: fp for name, fp in current.items() if isinstance(fp, str)}
+    current = {name: fp for name, fp in current.items() if name not in errors}
+    if args.update:
+        if errors:
+            for name, error in errors.items():
+                print(f"{name}: build failed: {error}")
+            sys.exit(1)
+        fingerprint.save(current, golden_path)
+        print(f"Stored {len(current)} fingerprints to {golden_path}")
+        sys.exit(0)
+
+    if not os.path.exists(golden_path):
+        print(f"No golden fingerprints at {golden_path}, run with --update first.")
+        sys.exit(1)
+    golden = fingerprint.load(golden_path)
+    failed = False
+    for name in sorted(set(current) | set(errors) | set(golden)):
+        if name in errors:
+            print(f"{name}: build failed: {errors[name]}")
+        elif name not in golden:
+            print(f"{name}: no golden fingerprint")
+        elif name not in current:
+            print(f"{name}: not built")
+        else:
+            diff = current[name].diff(golden[name])
+            if not diff:
+                print(f"{name}: OK")
+                continue
+            print(f"{name}: " + ", ".join(diff))
+        failed = True
+    sys.exit(1 if failed else 0)
@@ -1,10 +1,9 @@
-from build123d import *
-
 from math import sin, cos, tan, asin, acos, atan, atan2, pi, floor, sqrt, degrees
 from dataclasses import dataclass
 from util import circle_pivot_tangent_angle, tangent_pos
 
-from ocp_vscode import *
+# The dimensions and tangent_angle() are pure math, importable without the CAD kernel.
+# build123d is only imported by the methods producing geometry.
 
 @dataclass
 class ChocoTerminal:
@@ -37,6 +36,7 @@ class ChocoTerminal:
     # Create terminal outer contour in XY plane with the flat side pointing up,
     # terminal hole centered at (0, 0).
     def outer_profile(self, offset=0):
+        from build123d import Axis, Curve, JernArc, Line, Plane, Wire, make_face, mirror
         r2 = self.outer_diameter / 2
         top = self.height - r2
         c = Curve() + [
@@ -52,6 +52,7 @@ class ChocoTerminal:
         return make_face(w)
 
     def hole(self):
+        from build123d import Circle
         return Circle(self.inner_diameter / 2)
 
     # Create terminal outer contour in XY plane with the flat side pointing up, drill the hole.
@@ -61,6 +62,7 @@ class ChocoTerminal:
     # Create terminal outer contour in XY plane with the flat side pointing up,
     # tilted so that the right side is vertical and the left side has a 45 degree taper to the top.
     def teardrop_profile(self, offset):
+        from build123d import Curve, IntersectingLine, Line, Polyline, Rotation, Vector, make_face
         profile = Rotation(0, 0, -self.tangent_angle()) * self.outer_profile(offset)
         edges = profile.edges()
         teardrop_pos = tangent_pos(edges, tangent_angle=-45-90, max_dir=Vector(-1, 1))
@@ -84,6 +86,7 @@ class ChocoTerminal:
     # Create terminal outer contour in XY plane with the flat side pointing up,
     # tilted so that the right side is vertical and the left side has a 45 degree taper to the top.
     def teardrop_profile_inner(self, offset):
+        from build123d import Axis, Curve, IntersectingLine, Line, Polyline, Rotation, Vector, make_face
         profile = Rotation(0, 0, -self.tangent_angle()) * self.outer_profile(offset)
         edges = profile.edges()
         tangent_angle = 55
@@ -100,6 +103,7 @@ class ChocoTerminal:
 
     # Length of the terminal is aligned with the Z axis, centered along Z.
     def body(self, drill_screw_holes: bool = True):
+        from build123d import Align, Cylinder, Location, extrude
         b = Location([0, 0, - self.length / 2]) * \
             extrude(self.profile(), self.length)
         if drill_screw_holes:
@@ -1,6 +1,6 @@
 from math import sin, cos, tan, asin, acos, atan, atan2, pi, floor, sqrt, degrees
 
-from build123d import *
+# Pure math, importable without the CAD kernel.
 
 def circle_pivot_tangent_angle(r: float, x: float, y: float) -> float:
     """Calculate angle of a top tangent line from a circle at (0, 0) to a point (x, y).
@@ -8,7 +8,7 @@ def circle_pivot_tangent_angle(r: float, x: float, y: float) -> float:
     """
     return degrees(acos(r / sqrt(x**2 + y**2)) + atan(y / x))
 
-def tangent_pos(edges, tangent_angle, max_dir: Vector):
+def tangent_pos(edges, tangent_angle, max_dir: 'Vector'):
    tangent_pos = None
    max_xy = -1e10
    for edge in edges: